@@ -0,0 +1,95 @@
+import json
+import os
+import timeit
+
+import requests
+from dotenv import load_dotenv
+from edgar_decode import RawResponse, fetch_raw, orjson
+
+
+def load_env_var(var_name: str) -> str:
+    """Function to load an environment variable"""
+    load_dotenv()
+    value = os.getenv(var_name)
+    if value is None:
+        raise ValueError(
+            f"Environment variable '{var_name}' not found.\n"
+            f"Please make sure you made a .env file with your email address"
+        )
+    return value
+
+
+def benchmark_payload(raw_response: RawResponse, repeat: int = 5) -> dict:
+    """
+    Time decoding of an already downloaded payload.
+    Each timing is the best of `repeat` runs, in milliseconds.
+    """
+    uncompressed = raw_response.decompressed()
+
+    def best_ms(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+    results = {
+        "url": raw_response.url,
+        "content_encoding": raw_response.content_encoding or "identity",
+        "bytes_transferred": len(raw_response.body),
+        "bytes_uncompressed": len(uncompressed),
+        "decompress_ms": best_ms(raw_response.decompressed),
+        "stdlib_json_ms": best_ms(lambda: json.loads(uncompressed)),
+        "orjson_ms": best_ms(lambda: orjson.loads(uncompressed)) if orjson else None,
+        "full_redecode_ms": best_ms(raw_response.json),
+    }
+    return results
+
+
+def time_plain_download(api_url: str, user_agent: str) -> float:
+    """
+    Time an uncompressed download of the body only, no JSON decoding,
+    so it can be compared directly with the compressed download.
+    """
+    headers = {"User-Agent": user_agent, "Accept-Encoding": "identity"}
+    start = timeit.default_timer()
+    response = requests.get(api_url, headers=headers)
+    response.raise_for_status()
+    response.content
+    return (timeit.default_timer() - start) * 1000
+
+
+def print_results(results: dict):
+    """print one benchmark result block"""
+    print(f"\n{results['url']}")
+    for key, value in results.items():
+        if key == "url":
+            continue
+        if isinstance(value, float):
+            value = f"{value:.2f}"
+        print(f"  {key:<22} {value}")
+    ratio = results["bytes_uncompressed"] / max(results["bytes_transferred"], 1)
+    print(f"  {'compression_ratio':<22} {ratio:.1f}x")
+
+
+def run_benchmark(cik_str: str = "0001326801", period: str = "CY2022Q4I"):
+    """
+    Benchmark the decode layer on a companyfacts payload (META by default)
+    and an Assets frames payload, both of which are several MB uncompressed.
+    """
+    user_agent = load_env_var("EMAIL_ADDRESS")
+    api_urls = [
+        f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik_str}.json",
+        f"https://data.sec.gov/api/xbrl/frames/us-gaap/Assets/USD/{period}.json",
+    ]
+    print(f"JSON backend: {'orjson' if orjson else 'stdlib json'}")
+    for api_url in api_urls:
+        # download timings cover transport only; decoding is timed separately
+        start = timeit.default_timer()
+        raw_response = fetch_raw(api_url, user_agent)
+        compressed_ms = (timeit.default_timer() - start) * 1000
+
+        results = benchmark_payload(raw_response)
+        results["download_compressed_ms"] = compressed_ms
+        results["download_plain_ms"] = time_plain_download(api_url, user_agent)
+        print_results(results)
+
+
+if __name__ == "__main__":
+    run_benchmark()
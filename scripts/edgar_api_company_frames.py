@@ -3,6 +3,7 @@ import os
 import pandas as pd
 import requests
 from dotenv import load_dotenv
+from edgar_decode import fetch_cached
 
 
 def load_env_var(var_name: str) -> str:
@@ -17,6 +18,7 @@ def load_env_var(var_name: str) -> str:
 def request_api(api_url: str) -> dict:
     """
     Sends a GET request to the specified API URL with a User-Agent header.
+    Repeat requests for the same URL are decoded from the kept download.
 
     Returns:
         Dict[str, Any]: The JSON response from the API as a dictionary.
@@ -25,12 +27,9 @@ def request_api(api_url: str) -> dict:
         requests.RequestException: For issues with the request.
     """
     user_agent = load_env_var("EMAIL_ADDRESS")
-    headers = {"User-Agent": user_agent}
     try:
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        return fetch_cached(api_url, user_agent).json()
+    except (requests.RequestException, ValueError) as e:
         raise RuntimeError(f"An error occurred while requesting the API: {e}")
 
 
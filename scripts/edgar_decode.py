@@ -0,0 +1,121 @@
+import gzip
+import json
+import zlib
+from dataclasses import dataclass
+
+import requests
+from urllib3 import exceptions as urllib3_exceptions
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ACCEPT_ENCODING = "gzip, deflate"
+
+# compressed responses kept per URL so repeat requests skip the download
+RAW_CACHE: dict[str, "RawResponse"] = {}
+
+
+def decode_json(raw: bytes) -> dict:
+    """
+    Decode a JSON payload, using orjson when it is installed and the
+    stdlib json module otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def decompress_body(body: bytes, content_encoding: str) -> bytes:
+    """
+    Undo the transport compression of a response body.
+    Supports 'gzip' (or 'x-gzip'), 'deflate' (zlib-wrapped or raw) and
+    'identity', including stacked codings such as 'deflate, gzip'.
+    Raises:
+        ValueError: For an unsupported encoding or a corrupt body.
+    """
+    encodings = [e.strip().lower() for e in content_encoding.split(",")]
+    # codings are listed in the order they were applied, so undo them backwards
+    for encoding in reversed(encodings):
+        if encoding in ("", "identity"):
+            continue
+        try:
+            if encoding in ("gzip", "x-gzip"):
+                body = gzip.decompress(body)
+            elif encoding == "deflate":
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    # some servers send raw deflate without the zlib header
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)
+            else:
+                raise ValueError(
+                    f"Unsupported Content-Encoding: '{content_encoding}'"
+                )
+        except (OSError, EOFError, zlib.error) as e:
+            raise ValueError(f"Could not decompress '{content_encoding}' body: {e}")
+    return body
+
+
+@dataclass
+class RawResponse:
+    """
+    Response body exactly as it came over the wire, so it can be decoded
+    again later without another download.
+    """
+
+    url: str
+    content_encoding: str
+    body: bytes
+
+    def decompressed(self) -> bytes:
+        """return the uncompressed JSON bytes"""
+        return decompress_body(self.body, self.content_encoding)
+
+    def json(self) -> dict:
+        """decode the body with the fastest available JSON backend"""
+        return decode_json(self.decompressed())
+
+
+def read_raw_body(response: requests.Response) -> bytes:
+    """
+    Read the still-compressed body, translating urllib3 errors into the
+    requests exceptions that iter_content would have raised.
+    """
+    try:
+        return response.raw.read(decode_content=False)
+    except urllib3_exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e)
+    except urllib3_exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e)
+    except urllib3_exceptions.SSLError as e:
+        raise requests.exceptions.SSLError(e)
+    except urllib3_exceptions.HTTPError as e:
+        raise requests.exceptions.ChunkedEncodingError(e)
+
+
+def fetch_raw(api_url: str, user_agent: str) -> RawResponse:
+    """
+    Sends a GET request asking for a gzip/deflate body and keeps the
+    compressed bytes instead of letting requests decode them.
+    Raises:
+        requests.RequestException: For issues with the request.
+    """
+    headers = {"User-Agent": user_agent, "Accept-Encoding": ACCEPT_ENCODING}
+    with requests.get(api_url, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        body = read_raw_body(response)
+        content_encoding = response.headers.get("Content-Encoding", "")
+    return RawResponse(url=api_url, content_encoding=content_encoding, body=body)
+
+
+def fetch_cached(api_url: str, user_agent: str) -> RawResponse:
+    """
+    Like fetch_raw, but reuses the kept compressed body when the same URL
+    was already downloaded. Every call decodes a fresh dict, so callers can
+    modify the result without affecting each other.
+    """
+    if api_url not in RAW_CACHE:
+        RAW_CACHE[api_url] = fetch_raw(api_url, user_agent)
+    return RAW_CACHE[api_url]
@@ -0,0 +1,81 @@
+import gzip
+import json
+import zlib
+
+import edgar_decode
+import pytest
+from edgar_decode import RawResponse, decompress_body, fetch_cached
+
+PAYLOAD = {"cik": 1326801, "facts": {"us-gaap": {"Assets": [1, 2, 3]}}}
+RAW_JSON = json.dumps(PAYLOAD).encode()
+
+
+@pytest.mark.parametrize(
+    "content_encoding, body",
+    [
+        ("gzip", gzip.compress(RAW_JSON)),
+        ("deflate", zlib.compress(RAW_JSON)),
+        ("deflate", zlib.compress(RAW_JSON)[2:-4]),  # raw deflate, no zlib header
+        ("identity", RAW_JSON),
+        ("", RAW_JSON),
+        (" GZIP ", gzip.compress(RAW_JSON)),
+        ("x-gzip", gzip.compress(RAW_JSON)),
+        ("deflate, gzip", gzip.compress(zlib.compress(RAW_JSON))),
+        ("gzip,deflate", zlib.compress(gzip.compress(RAW_JSON))),
+        ("identity, gzip", gzip.compress(RAW_JSON)),
+    ],
+)
+def test_decompress_body(content_encoding, body):
+    assert decompress_body(body, content_encoding) == RAW_JSON
+
+
+def test_decompress_body_unsupported_encoding():
+    with pytest.raises(ValueError, match="Unsupported"):
+        decompress_body(RAW_JSON, "br")
+
+
+def test_decompress_body_unsupported_stacked_encoding():
+    with pytest.raises(ValueError, match="Unsupported"):
+        decompress_body(gzip.compress(RAW_JSON), "br, gzip")
+
+
+@pytest.mark.parametrize(
+    "content_encoding, body",
+    [
+        ("gzip", gzip.compress(RAW_JSON)[:-10]),  # truncated -> EOFError
+        ("gzip", b"\x1f\x8b" + b"\x00" * 20),  # corrupt -> BadGzipFile
+        ("deflate", b"not deflate at all"),  # -> zlib.error
+    ],
+)
+def test_decompress_body_corrupt(content_encoding, body):
+    with pytest.raises(ValueError, match="Could not decompress"):
+        decompress_body(body, content_encoding)
+
+
+def test_raw_response_keeps_body_and_redecodes():
+    body = gzip.compress(RAW_JSON)
+    raw_response = RawResponse(url="u", content_encoding="gzip", body=body)
+    assert raw_response.json() == PAYLOAD
+    assert raw_response.json() == PAYLOAD
+    assert raw_response.body == body
+
+
+def test_raw_response_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(edgar_decode, "orjson", None)
+    raw_response = RawResponse(url="u", content_encoding="", body=RAW_JSON)
+    assert raw_response.json() == PAYLOAD
+
+
+def test_fetch_cached_downloads_once(monkeypatch):
+    calls = []
+
+    def fake_fetch_raw(api_url, user_agent):
+        calls.append(api_url)
+        return RawResponse(api_url, "gzip", gzip.compress(RAW_JSON))
+
+    monkeypatch.setattr(edgar_decode, "fetch_raw", fake_fetch_raw)
+    monkeypatch.setattr(edgar_decode, "RAW_CACHE", {})
+    first = fetch_cached("u", "agent").json()
+    first["cik"] = 0
+    assert fetch_cached("u", "agent").json() == PAYLOAD
+    assert calls == ["u"]